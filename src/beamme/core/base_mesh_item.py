@@ -28,6 +28,10 @@ sets and materials."""
 class BaseMeshItem:
     """Base class for boundary conditions, functions, geometry sets and materials."""
 
+    # The slot only backs the lazily created `data` property. Derived classes do not
+    # define slots, so their instances still have a `__dict__`.
+    __slots__ = ("_data",)
+
     def __init__(self, data: dict | None = None):
         """Create the base object.
 
@@ -35,7 +39,17 @@ class BaseMeshItem:
             data: General data to be stored for this item. Defaults to
                 and empty dictionary.
         """
-        if data is not None:
-            self.data = data
-        else:
-            self.data = {}
+        # The empty default dictionary is only created once it is accessed.
+        self._data = data
+
+    @property
+    def data(self) -> dict:
+        """Return the general data stored for this item."""
+        if self._data is None:
+            self._data = {}
+        return self._data
+
+    @data.setter
+    def data(self, data: dict) -> None:
+        """Set the general data stored for this item."""
+        self._data = data
@@ -0,0 +1,56 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2026 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This script is used to test the functionality of the base mesh item."""
+
+from beamme.core.base_mesh_item import BaseMeshItem
+
+
+def test_beamme_core_base_mesh_item_data_default():
+    """Test that each item without given data gets its own empty dictionary."""
+    item_1 = BaseMeshItem()
+    item_2 = BaseMeshItem()
+
+    assert item_1.data == {}
+    assert item_2.data == {}
+    assert item_1.data is not item_2.data
+
+    # The default dictionary has to persist between accesses.
+    item_1.data["key"] = "value"
+    assert item_1.data == {"key": "value"}
+    assert item_2.data == {}
+
+
+def test_beamme_core_base_mesh_item_data_given():
+    """Test that given data is stored without modification."""
+    data = {"key": "value"}
+    item = BaseMeshItem(data)
+
+    assert item.data is data
+
+
+def test_beamme_core_base_mesh_item_data_setter():
+    """Test that the data of an item can be replaced."""
+    item = BaseMeshItem()
+    data = {"key": "value"}
+    item.data = data
+
+    assert item.data is data
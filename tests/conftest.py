@@ -22,7 +22,11 @@
 """Base testing framework infrastructure."""
 
 import os
+import sys
+import time
 from collections.abc import Callable
+from functools import cache, lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
@@ -38,9 +42,27 @@ pytest_plugins = [
     "tests.conftest_test_object_generators",
 ]
 
+# Directories that do not contain any tests and should not be searched for tests
+collect_ignore = ["reference-files"]
+
+# Path to the directory containing the reference files
+REFERENCE_FILE_DIRECTORY = Path(__file__).resolve().parent / "reference-files"
+
 # Track used and unused reference files during testing if corresponding flag is enabled
-USED_REFERENCE_FILES: set[str] = set()
-UNUSED_REFERENCE_FILES: set[str] = set()
+USED_REFERENCE_FILES: set[Path] = set()
+UNUSED_REFERENCE_FILES: set[Path] = set()
+
+# Command line flags and the test markers they enable
+_FLAG_MARKERS = (
+    ("--4C", "fourc"),
+    ("--ArborX", "arborx"),
+    ("--Coreform", "coreform"),
+    ("--performance-tests", "performance"),
+)
+
+# Markers that are not relevant for the test selection
+_IGNORED_MARKERS = frozenset({"parametrize"})
+_get_marker_name = attrgetter("name")
 
 
 def pytest_addoption(parser: Parser) -> None:
@@ -132,20 +154,27 @@ def pytest_collection_modifyitems(config: Config, items: list) -> None:
         `pytest --exclude-standard-tests`: Execute tests with any other marker and exclude the standard unmarked tests
         `pytest --check-for-unused-reference-files`: Check for unused reference files in the reference file directory
 
+    If the environment variable `BEAMME_PROFILE_COLLECT` is set, the time spent in
+    this hook is printed to stderr.
+
     Args:
         config: Pytest config
         items: Pytest list of tests
     """
+    profile_collection = bool(os.environ.get("BEAMME_PROFILE_COLLECT"))
+    if profile_collection:
+        start_time = time.perf_counter()
+        n_items = len(items)
+
     # Get all active markers for this pytest run
-    active_markers = set()
-    for flag, marker in zip(
-        ["--4C", "--ArborX", "--Coreform", "--performance-tests"],
-        ["fourc", "arborx", "coreform", "performance"],
-    ):
-        if config.getoption(flag):
-            active_markers.add(marker)
+    active_markers = frozenset(
+        marker for flag, marker in _FLAG_MARKERS if config.getoption(flag)
+    )
+
+    exclude_standard_tests = config.getoption("--exclude-standard-tests")
 
     selected_tests = []
+    deselected_tests = []
 
     # loop over all collected tests
     for item in items:
@@ -153,32 +182,38 @@ def pytest_collection_modifyitems(config: Config, items: list) -> None:
 
         # Get all set markers for current test (e.g. `4C`, `ArborX`, `Coreform`, ...)
         # We don't care about the "parametrize" marker here
-        markers = set(
-            marker.name
-            for marker in item.iter_markers()
-            if not marker.name == "parametrize"
-        )
+        markers = set(map(_get_marker_name, item.iter_markers())) - _IGNORED_MARKERS
 
         if markers:
-            if markers.issubset(active_markers):
-                selected_tests.append(item)
+            keep = markers.issubset(active_markers)
+        else:
+            keep = not exclude_standard_tests
 
-        elif not config.getoption("--exclude-standard-tests"):
+        if keep:
             selected_tests.append(item)
+        else:
+            deselected_tests.append(item)
 
-    selected_tests_unique = list(
-        dict.fromkeys(selected_tests).keys()
-    )  # remove duplicates while preserving order
+    items[:] = selected_tests
+    config.hook.pytest_deselected(items=deselected_tests)
 
-    deselected_tests = list(set(items) - set(selected_tests_unique))
+    if profile_collection:
+        print(
+            f"pytest_collection_modifyitems: {time.perf_counter() - start_time:.3f}s, "
+            f"{n_items} items ({len(selected_tests)} selected)",
+            file=sys.stderr,
+        )
 
-    items[:] = selected_tests_unique
-    config.hook.pytest_deselected(items=deselected_tests)
 
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Reset the global bme object before each test.
+
+    This is done in a hook instead of an autouse fixture, so no fixture has to be
+    resolved for each test.
 
-@pytest.fixture(autouse=True)
-def run_before_each_test():
-    """Reset the global bme object before each test."""
+    Args:
+        item: Pytest test item that is about to be set up
+    """
     bme.set_default_values()
 
 
@@ -189,8 +224,30 @@ def reference_file_directory() -> Path:
     Returns:
         Path: A Path object representing the full path to the reference file directory.
     """
-    testing_path = Path(__file__).resolve().parent
-    return testing_path / "reference-files"
+    return REFERENCE_FILE_DIRECTORY
+
+
+@cache
+def _get_reference_files() -> frozenset[Path]:
+    """Return the paths of all files in the reference file directory.
+
+    The directory is only scanned once per session, the result is shared between
+    the `reference_files` fixture and the check for unused reference files.
+
+    Returns:
+        Set with the paths to all reference files.
+    """
+    return frozenset(p for p in REFERENCE_FILE_DIRECTORY.rglob("*") if p.is_file())
+
+
+@pytest.fixture(scope="session")
+def reference_files() -> frozenset[Path]:
+    """Provide the paths of all files in the reference file directory.
+
+    Returns:
+        Set with the paths to all reference files.
+    """
+    return _get_reference_files()
 
 
 @pytest.fixture(scope="function")
@@ -206,9 +263,28 @@ def current_test_name(request: pytest.FixtureRequest) -> str:
     return request.node.originalname
 
 
+@lru_cache(maxsize=1024)
+def _get_reference_file_path(
+    reference_file_directory: Path, reference_file_name: str
+) -> Path:
+    """Return the path to a reference file.
+
+    The paths are cached, as the same reference files are usually requested
+    multiple times during a test session.
+
+    Args:
+        reference_file_directory: Path to the reference file directory.
+        reference_file_name: Name of the reference file.
+
+    Returns:
+        Path to the reference file.
+    """
+    return reference_file_directory / reference_file_name
+
+
 @pytest.fixture(scope="function")
 def get_corresponding_reference_file_path(
-    reference_file_directory, current_test_name
+    reference_file_directory, reference_files, current_test_name
 ) -> Callable:
     """Return function to get path to corresponding reference file for each test.
 
@@ -267,17 +343,17 @@ def get_corresponding_reference_file_path(
 
         corresponding_reference_file += "." + extension
 
-        corresponding_reference_file_path = (
-            reference_file_directory / corresponding_reference_file
+        corresponding_reference_file_path = _get_reference_file_path(
+            reference_file_directory, corresponding_reference_file
         )
 
-        if not os.path.isfile(corresponding_reference_file_path):
+        if corresponding_reference_file_path not in reference_files:
             raise AssertionError(
                 f"File path: {corresponding_reference_file_path} does not exist"
             )
 
         # Track usage of reference files
-        USED_REFERENCE_FILES.add(corresponding_reference_file_path.resolve())
+        USED_REFERENCE_FILES.add(corresponding_reference_file_path)
 
         return corresponding_reference_file_path
 
@@ -291,14 +367,7 @@ def sessionfinish_unused_reference_files(session):
     reference files are detected when the corresponding flag is enabled.
     """
     if session.config.getoption("--check-for-unused-reference-files"):
-        # reference_file_directory fixture is not able to be used here (fixtures cannot be called directly)
-        reference_file_directory = Path(__file__).resolve().parent / "reference-files"
-
-        all_reference_files = {
-            p.resolve() for p in reference_file_directory.rglob("*") if p.is_file()
-        }
-
-        UNUSED_REFERENCE_FILES.update(all_reference_files - USED_REFERENCE_FILES)
+        UNUSED_REFERENCE_FILES.update(_get_reference_files() - USED_REFERENCE_FILES)
 
         if UNUSED_REFERENCE_FILES:
             session.exitstatus = 1
@@ -156,7 +156,7 @@ def convert_to_primitive_type(
                     mesh_file_path
                 )
                 # Add the file to the set of used reference files.
-                USED_REFERENCE_FILES.add(mesh_file_path.resolve())
+                USED_REFERENCE_FILES.add(mesh_file_path)
             return sections
 
         elif obj.suffix == ".inp":
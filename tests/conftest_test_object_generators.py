@@ -39,6 +39,16 @@ from beamme.four_c.material import (
     MaterialStVenantKirchhoff,
 )
 
+# Default beam materials for testing purposes. Each entry maps the material type to
+# the material class and its default parameters.
+_DEFAULT_TEST_BEAM_MATERIALS: dict[str, tuple[type[MaterialBeamBase], dict]] = {
+    "base": (MaterialBeamBase, {"radius": 1.0}),
+    "reissner": (
+        MaterialReissner,
+        {"radius": 1.0, "youngs_modulus": 1.0, "nu": 0.3, "density": 1.0},
+    ),
+}
+
 
 @pytest.fixture(scope="function")
 def get_bc_data() -> Callable:
@@ -87,17 +97,14 @@ def get_default_test_beam_material() -> Callable:
         Returns:
             A material object corresponding to the specified beam type.
         """
-        if material_type == "base":
-            return MaterialBeamBase(radius=1.0, **kwargs)
-
-        elif material_type == "reissner":
-            return MaterialReissner(
-                radius=1.0, youngs_modulus=1.0, nu=0.3, density=1.0, **kwargs
-            )
-
-        else:
+        if material_type not in _DEFAULT_TEST_BEAM_MATERIALS:
             raise ValueError(f"Unknown beam type: {material_type}")
 
+        material_class, default_parameters = _DEFAULT_TEST_BEAM_MATERIALS[
+            material_type
+        ]
+        return material_class(**default_parameters, **kwargs)
+
     return _get_default_test_beam_material
 
 